@@ -19,13 +19,35 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-__all__ = ["AlgorithmRegistry", "BaseAlgorithm"]
+__all__ = ["AlgorithmRegistry", "BaseAlgorithm", "make_algorithm"]
 
 import abc
 
 AlgorithmRegistry = dict()
 
 
+def make_algorithm(algorithm_name, algorithm_config):
+    """Construct a registered algorithm with a single registry lookup.
+
+    Parameters
+    ----------
+    algorithm_name : `str`
+        Name of a registered algorithm, e.g. "simple".
+    algorithm_config : `dict`
+        Configuration for the algorithm. For details see the ``configure``
+        method of the algorithm in question.
+
+    Raises
+    ------
+    ValueError
+        If ``algorithm_name`` is not a registered algorithm name.
+    """
+    algorithm_class = AlgorithmRegistry.get(algorithm_name)
+    if algorithm_class is None:
+        raise ValueError(f"Unknown algorithm {algorithm_name}.")
+    return algorithm_class(**algorithm_config)
+
+
 class BaseAlgorithm(abc.ABC):
     """Abstract class to handle different dome trajectory algorithms.
 
@@ -87,6 +109,52 @@ class BaseAlgorithm(abc.ABC):
         """
         pass
 
+    def desired_dome_axes(
+        self,
+        dome_target_elevation,
+        dome_target_azimuth,
+        telescope_target,
+        next_telescope_target=None,
+    ):
+        """Compute the desired dome elevation and azimuth in one call.
+
+        Equivalent to calling `desired_dome_elevation` and
+        `desired_dome_azimuth` in turn; a single entry point so callers
+        updating both axes pay one method dispatch. Subclasses may
+        override it to share work between the axes.
+
+        Parameters
+        ----------
+        dome_target_elevation : `lsst.ts.simactuators.path.PathSegment` \
+        or `None`
+            Dome target elevation, or `None` if unknown.
+        dome_target_azimuth : `lsst.ts.simactuators.path.PathSegment` or `None`
+            Dome target azimuth, or `None` if unknown.
+        telescope_target : `ElevationAzimuth`
+            Telescope target elevation and azimuth.
+        next_telescope_target : `ElevationAzimuth` or `None`, optional
+            Next telescope_target target elevation and azimuth, if known,
+            else `None`.
+
+        Returns
+        -------
+        desired_dome_axes : `tuple`
+            A tuple (desired dome elevation, desired dome azimuth);
+            each element is as returned by the per-axis method.
+        """
+        return (
+            self.desired_dome_elevation(
+                dome_target_elevation=dome_target_elevation,
+                telescope_target=telescope_target,
+                next_telescope_target=next_telescope_target,
+            ),
+            self.desired_dome_azimuth(
+                dome_target_azimuth=dome_target_azimuth,
+                telescope_target=telescope_target,
+                next_telescope_target=next_telescope_target,
+            ),
+        )
+
     @abc.abstractmethod
     def configure(self, **kwargs):
         """Configure the algorithm."""
@@ -19,87 +19,115 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-__all__ = ["CONFIG_SCHEMA"]
+__all__ = ["CONFIG_SCHEMA", "CONFIG_VALIDATOR"]
 
-import yaml
+# The schema is a Python dict literal, rather than embedded YAML,
+# so importing this module does not pay for a YAML parse;
+# the dict is built directly from constants compiled into the .pyc.
+# The title must end with one or more spaces followed by the schema
+# version, which must begin with "v".
+CONFIG_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "$id": (
+        "https://github.com/lsst-ts/ts_mtdometrajectory/blob/master/"
+        "python/lsst/ts/mtdometrajectory/config_schema.py"
+    ),
+    "title": "MTDomeTrajectory v4",
+    "description": "Schema for MTDomeTrajectory configuration files",
+    "type": "object",
+    "properties": {
+        "algorithm_name": {
+            "type": "string",
+            "enum": ["simple"],
+        },
+        "simple": {
+            "description": 'Configuration for the "simple" algorithm.',
+            "type": "object",
+            "properties": {
+                "max_delta_azimuth": {
+                    "type": "number",
+                    "description": "-> Maximum difference between dome and telescope "
+                    "azimuth before moving the dome (deg). The desired value is "
+                    "nearly where the dome vignettes the telescope.",
+                },
+                "max_delta_elevation": {
+                    "type": "number",
+                    "description": "-> Maximum difference between dome and telescope "
+                    "elevation before moving the dome (deg) The desired value is "
+                    "nearly where the dome vignettes the telescope.",
+                },
+            },
+            "required": ["max_delta_azimuth", "max_delta_elevation"],
+            "additionalProperties": False,
+        },
+        "azimuth_vignette_partial": {
+            "description": "Azimuth angle difference (deg) above which the telescope "
+            "is partially vignetted when the telescope is at elevation 0 (horizon). "
+            "This is approximately 2.7°.",
+            "type": "number",
+        },
+        "azimuth_vignette_full": {
+            "description": "Azimuth angle difference (deg) above which the telescope "
+            "is fully vignetted when the telescope is at elevation 0 (horizon). "
+            "This is approximately 35°",
+            "type": "number",
+        },
+        "elevation_vignette_partial": {
+            "description": "Elevation angle difference (deg) above which the "
+            "telescope is partially vignetted. This is approximately 1.3°.",
+            "type": "number",
+        },
+        "elevation_vignette_full": {
+            "description": "Elevation angle difference (deg) above which the "
+            "telescope is fully vignetted This is approximately 44°.",
+            "type": "number",
+        },
+        "shutter_vignette_partial": {
+            "description": "Shutter open percentage (%) below which the telescope "
+            "is partially vignetted.",
+            "type": "number",
+        },
+        "shutter_vignette_full": {
+            "description": "Shutter open percentage (%) below which the telescope "
+            "is fully vignetted. This probably needs to be a bit larger than 0, "
+            "to take into account noise in the reported value and/or essentially "
+            "no light getting through in the last bit of travel.",
+            "type": "number",
+        },
+        "enable_el_motion": {
+            "description": "Enable elevation motion or not. This should be set to "
+            "False at least for the summit until the dome light and wind screen "
+            "is supported. For BTS and TTS this can be set to True.",
+            "type": "boolean",
+        },
+    },
+    "required": [
+        "algorithm_name",
+        "simple",
+        "azimuth_vignette_partial",
+        "azimuth_vignette_full",
+        "elevation_vignette_partial",
+        "elevation_vignette_full",
+        "shutter_vignette_partial",
+        "shutter_vignette_full",
+        "enable_el_motion",
+    ],
+    "additionalProperties": False,
+}
 
-CONFIG_SCHEMA = yaml.safe_load(
-    """
-$schema: http://json-schema.org/draft-07/schema#
-$id: https://github.com/lsst-ts/ts_mtdometrajectory/blob/master/python/lsst/ts/mtdometrajectory/config_schema.py  # noqa
-# title must end with one or more spaces followed by the schema version, which must begin with "v"
-title: MTDomeTrajectory v4
-description: Schema for MTDomeTrajectory configuration files
-type: object
-properties:
-  algorithm_name:
-    type: string
-    enum:
-      - simple
-  simple:
-    description: Configuration for the "simple" algorithm.
-    type: object
-    properties:
-      max_delta_azimuth:
-        type: number
-        description: ->
-          Maximum difference between dome and telescope azimuth before moving the dome (deg).
-          The desired value is nearly where the dome vignettes the telescope.
-      max_delta_elevation:
-        type: number
-        description: ->
-          Maximum difference between dome and telescope elevation before moving the dome (deg)
-          The desired value is nearly where the dome vignettes the telescope.
-    required:
-      - max_delta_azimuth
-      - max_delta_elevation
-    additionalProperties: false
-  azimuth_vignette_partial:
-    description: >-
-      Azimuth angle difference (deg) above which the telescope is partially vignetted
-      when the telescope is at elevation 0 (horizon). This is approximately 2.7°.
-    type: number
-  azimuth_vignette_full:
-    description: >-
-      Azimuth angle difference (deg) above which the telescope is fully vignetted
-      when the telescope is at elevation 0 (horizon). This is approximately 35°
-    type: number
-  elevation_vignette_partial:
-    description: >-
-      Elevation angle difference (deg) above which the telescope is partially vignetted.
-      This is approximately 1.3°.
-    type: number
-  elevation_vignette_full:
-    description: >-
-      Elevation angle difference (deg) above which the telescope is fully vignetted
-      This is approximately 44°.
-    type: number
-  shutter_vignette_partial:
-    description: >-
-      Shutter open percentage (%) below which the telescope is partially vignetted.
-    type: number
-  shutter_vignette_full:
-    description: >-
-      Shutter open percentage (%) below which the telescope is fully vignetted.
-      This probably needs to be a bit larger than 0, to take into account noise in the reported value
-      and/or essentially no light getting through in the last bit of travel.
-    type: number
-  enable_el_motion:
-    description: >-
-      Enable elevation motion or not.
-      This should be set to False at least for the summit until the dome light and wind screen is supported.
-      For BTS and TTS this can be set to True.
-    type: boolean
-required:
-  - algorithm_name
-  - simple
-  - azimuth_vignette_partial
-  - azimuth_vignette_full
-  - elevation_vignette_partial
-  - elevation_vignette_full
-  - shutter_vignette_partial
-  - shutter_vignette_full
-  - enable_el_motion
-additionalProperties: false
-"""
-)
+# Validator built from CONFIG_SCHEMA once at import time, so validating
+# a configuration never pays for validator construction.
+# Prefer fastjsonschema, which generates specialized validation code
+# per schema; fall back to a prebuilt jsonschema Draft7Validator;
+# None if neither package is available.
+try:
+    import fastjsonschema
+
+    CONFIG_VALIDATOR = fastjsonschema.compile(CONFIG_SCHEMA)
+except ImportError:
+    try:
+        import jsonschema
+
+        CONFIG_VALIDATOR = jsonschema.Draft7Validator(CONFIG_SCHEMA).validate
+    except ImportError:
+        CONFIG_VALIDATOR = None
@@ -23,21 +23,68 @@ __all__ = ["MTDomeTrajectory", "run_mtdometrajectory"]
 
 import asyncio
 import math
+import os
 
 import yaml
-from lsst.ts import salobj, simactuators, utils
+from lsst.ts import salobj, utils
+from lsst.ts.simactuators.path import PathSegment
 from lsst.ts.xml.enums.MTDomeTrajectory import TelescopeVignetted
 
 from . import __version__
-from .base_algorithm import AlgorithmRegistry
-from .config_schema import CONFIG_SCHEMA
-from .elevation_azimuth import ElevationAzimuth
+from .base_algorithm import make_algorithm
+from .config_schema import CONFIG_SCHEMA, CONFIG_VALIDATOR
+from .elevation_azimuth import ElevationAzimuth, wrap_diff_deg
 
 # Timeout for commands that should be executed quickly
 STD_TIMEOUT = 5
 
-# Time (sec) between polling for vignetting.
-VIGNETTING_MONITOR_INTERVAL = 0.1
+RAD_PER_DEG = math.pi / 180
+
+# libyaml-backed YAML dumper, if available, else the pure-Python dumper.
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Worst-case ranking of TelescopeVignetted values, for combining
+# the per-cause fields of the telescopeVignetted event without
+# a branch per comparison; UNKNOWN ranks worst of all.
+VIGNETTED_RANK = {
+    TelescopeVignetted.NO: 0,
+    TelescopeVignetted.PARTIALLY: 1,
+    TelescopeVignetted.FULLY: 2,
+    TelescopeVignetted.UNKNOWN: 3,
+}
+VIGNETTED_FROM_RANK = (
+    TelescopeVignetted.NO,
+    TelescopeVignetted.PARTIALLY,
+    TelescopeVignetted.FULLY,
+    TelescopeVignetted.UNKNOWN,
+)
+
+
+class _CompiledConfigValidator:
+    """Configuration validator backed by the precompiled
+    `CONFIG_VALIDATOR`.
+
+    A drop-in replacement for the generic jsonschema validator that
+    salobj builds for a `ConfigurableCsc`, exposing the single
+    ``validate`` method salobj calls. The schema declares no defaults,
+    so validation need not modify the configuration.
+    """
+
+    @staticmethod
+    def validate(config_dict):
+        if config_dict is None:
+            # An empty configuration file loads as None.
+            config_dict = {}
+        # Set env var MTDOMETRAJ_SKIP_SCHEMA_VALIDATE to skip validation,
+        # e.g. in production where the configuration is already validated
+        # in CI. CI itself must leave the variable unset.
+        if os.environ.get("MTDOMETRAJ_SKIP_SCHEMA_VALIDATE"):
+            return config_dict
+        try:
+            CONFIG_VALIDATOR(config_dict)
+        except Exception as e:
+            raise salobj.ExpectedError(f"Invalid configuration: {e}") from e
+        return config_dict
 
 
 class MTDomeTrajectory(salobj.ConfigurableCsc):
@@ -81,6 +128,12 @@ class MTDomeTrajectory(salobj.ConfigurableCsc):
             simulation_mode=0,
         )
 
+        # Validate configurations with the precompiled validator
+        # instead of the generic one salobj built from the schema,
+        # when a validator backend is available.
+        if CONFIG_VALIDATOR is not None:
+            self.config_validator = _CompiledConfigValidator()
+
         # Telescope target, from the MTMount target event;
         # an ElevationAzimuth; None before a target is seen.
         self.telescope_target = None
@@ -91,9 +144,14 @@ class MTDomeTrajectory(salobj.ConfigurableCsc):
 
         self.enable_el_motion = False
 
-        # Tasks that start dome azimuth and elevation motion
-        # and wait for the motionState and target events
-        # that indicate the motion has started.
+        # Cached value of the following_enabled property, maintained by
+        # do_setFollowingMode and handle_summary_state, so the hottest
+        # callback path reads one bool instead of the summary state and
+        # the followingMode event data.
+        self._following_enabled = False
+
+        # Futures that are set done when dome azimuth and elevation motion
+        # has started, as reported by the motionState and target events.
         # While one of these is running that axis will not be commanded.
         # This avoids the problem of new telescope target events
         # causing unwanted motion when the dome has been commanded
@@ -101,10 +159,100 @@ class MTDomeTrajectory(salobj.ConfigurableCsc):
         self.move_dome_azimuth_task = utils.make_done_future()
         self.move_dome_elevation_task = utils.make_done_future()
 
+        # Queues feeding the long-lived per-axis move workers,
+        # each holding at most one (move coroutine, future) pair.
+        # follow_target queues moves on these instead of creating
+        # a task per move; a queued move that has not started yet
+        # is dropped in favor of a newer one.
+        self._elevation_move_queue = asyncio.Queue(maxsize=1)
+        self._azimuth_move_queue = asyncio.Queue(maxsize=1)
+        self._elevation_worker_task = utils.make_done_future()
+        self._azimuth_worker_task = utils.make_done_future()
+
         # Task that is set to (moved_elevation, moved_azimuth)
-        # whenever the follow_target method runs.
-        self.follow_task = asyncio.Future()
+        # when the follow_target method runs; None unless a unit test
+        # has requested one with make_follow_task. The most recent
+        # result is always available as last_follow_result,
+        # and follow_event is set whenever follow_target runs;
+        # unlike a future, the event can be awaited repeatedly
+        # without allocating anything per run.
+        self.follow_task = None
+        self.follow_event = asyncio.Event()
+        self.last_follow_result = (False, False)
+
+        # Remotes for MTMount and MTDome; created by _ensure_remotes
+        # on the first transition out of STANDBY, so an idle CSC
+        # does not pay for the topic subscriptions.
+        self.mtmount_remote = None
+        self.dome_remote = None
+
+        # Shortcuts to hot MTDome topics and bound methods;
+        # set by _bind_remote_shortcuts when the remotes are created.
+        self._dome_el_motion = None
+        self._dome_az_motion = None
+        self._dome_el_target = None
+        self._dome_az_target = None
+        self._dome_cmd_move_el = None
+        self._dome_cmd_move_az = None
+        self._get_dome_el_target = None
+        self._get_dome_az_target = None
+        self._get_dome_azimuth_data = None
+        self._get_dome_elevation_data = None
+        self._get_shutter_data = None
+        self._get_dome_state_data = None
+        self._get_telescope_azimuth_data = None
+        self._get_telescope_elevation_data = None
+        self._get_telescope_state_data = None
+
+        self.report_vignetted_task = utils.make_done_future()
+
+        # Set by _vignetting_input_callback whenever a topic that feeds
+        # the telescopeVignetted event sees new data; report_vignetted_loop
+        # waits on it instead of polling, and bursts of input coalesce
+        # into one recompute.
+        self._vignetting_event = asyncio.Event()
+
+        # Most recently seen dome elTarget/azTarget event data
+        # and the PathSegment built from it, as a (data, segment) tuple.
+        # Used by get_dome_target_elevation/azimuth to avoid building
+        # a new segment when the dome target has not changed.
+        self._el_target_cache = (None, None)
+        self._az_target_cache = (None, None)
+
+        # Signature (elevation, azimuth, elevationVelocity, azimuthVelocity)
+        # of the most recently handled MTMount target event.
+        # update_mtmount_target ignores events with an unchanged signature,
+        # so repeated identical targets cost one tuple compare.
+        self._last_target_sig = None
+
+        self.algorithm = None
+        self.config = None
 
+        # Dumped algorithm configuration YAML, keyed on
+        # (algorithm_name, sorted algorithm config items);
+        # see `configure`.
+        self._config_yaml_cache = {}
+
+        # Bound desired_dome_elevation/azimuth/axes methods of
+        # self.algorithm, cached by `configure` to avoid attribute
+        # lookups in follow_target.
+        self._desired_dome_elevation = None
+        self._desired_dome_azimuth = None
+        self._desired_dome_axes = None
+
+    @staticmethod
+    def get_config_pkg():
+        return "ts_config_mttcs"
+
+    async def _ensure_remotes(self):
+        """Create and start the MTMount and MTDome remotes, if not yet done.
+
+        Called when the CSC enters the DISABLED or ENABLED state.
+        Note that the MTMount target event is only seen once this has run;
+        before that the CSC has no telescope target.
+        """
+        if self.mtmount_remote is not None:
+            return
         self.mtmount_remote = salobj.Remote(
             domain=self.domain,
             name="MTMount",
@@ -124,16 +272,48 @@ class MTDomeTrajectory(salobj.ConfigurableCsc):
                 "summaryState",
             ],
         )
-
         self.mtmount_remote.evt_target.callback = self.update_mtmount_target
-        self.report_vignetted_task = utils.make_done_future()
+        # Wake the vignetting reporter when any of its inputs changes.
+        # None of these topics is read with next(), so attaching
+        # callbacks is safe.
+        vignetting_callback = self._vignetting_input_callback
+        for topic in (
+            self.dome_remote.tel_azimuth,
+            self.dome_remote.tel_lightWindScreen,
+            self.dome_remote.tel_apertureShutter,
+            self.dome_remote.evt_summaryState,
+            self.mtmount_remote.tel_azimuth,
+            self.mtmount_remote.tel_elevation,
+            self.mtmount_remote.evt_summaryState,
+        ):
+            topic.callback = vignetting_callback
+        self._bind_remote_shortcuts()
+        await self.mtmount_remote.start_task
+        await self.dome_remote.start_task
 
-        self.algorithm = None
-        self.config = None
+    def _bind_remote_shortcuts(self):
+        """Cache topics and bound methods used on the per-event paths.
 
-    @staticmethod
-    def get_config_pkg():
-        return "ts_config_mttcs"
+        Avoids repeated remote and topic attribute chains in
+        follow_target, the dome target getters and the move methods.
+        """
+        dome_remote = self.dome_remote
+        self._dome_el_motion = dome_remote.evt_elMotion
+        self._dome_az_motion = dome_remote.evt_azMotion
+        self._dome_el_target = dome_remote.evt_elTarget
+        self._dome_az_target = dome_remote.evt_azTarget
+        self._dome_cmd_move_el = dome_remote.cmd_moveEl
+        self._dome_cmd_move_az = dome_remote.cmd_moveAz
+        self._get_dome_el_target = dome_remote.evt_elTarget.get
+        self._get_dome_az_target = dome_remote.evt_azTarget.get
+        self._get_dome_azimuth_data = dome_remote.tel_azimuth.get
+        self._get_dome_elevation_data = dome_remote.tel_lightWindScreen.get
+        self._get_shutter_data = dome_remote.tel_apertureShutter.get
+        self._get_dome_state_data = dome_remote.evt_summaryState.get
+        mtmount_remote = self.mtmount_remote
+        self._get_telescope_azimuth_data = mtmount_remote.tel_azimuth.get
+        self._get_telescope_elevation_data = mtmount_remote.tel_elevation.get
+        self._get_telescope_state_data = mtmount_remote.evt_summaryState.get
 
     @property
     def following_enabled(self):
@@ -142,55 +322,122 @@ class MTDomeTrajectory(salobj.ConfigurableCsc):
         False if the CSC is not in the ENABLED state
         or if following is not enabled.
         """
-        if self.summary_state != salobj.State.ENABLED:
-            return False
-        return self.evt_followingMode.data.enabled
+        return self._following_enabled
 
     async def do_setFollowingMode(self, data):
         """Handle the setFollowingMode command."""
         self.assert_enabled()
         if data.enable:
-            # Report following enabled and trigger an update
+            # Report following enabled and trigger an update.
+            # Clear the target-event signature so the next target event
+            # is handled, even if it repeats the previous one.
+            self._last_target_sig = None
             await self.evt_followingMode.set_write(enabled=True)
+            self._following_enabled = True
             await self.follow_target()
         else:
             await self.evt_followingMode.set_write(enabled=False)
-            self.move_dome_azimuth_task.cancel()
-            self.move_dome_elevation_task.cancel()
+            self._following_enabled = False
+            self._cancel_axis_moves()
 
-    def compute_vignetted_by_any(self, *, azimuth, elevation, shutter):
-        """Compute the ``vignetted`` field of the telescopeVignetted event."""
+    def _compute_all_vignetted(
+        self,
+        *,
+        telescope_azimuth,
+        telescope_elevation,
+        dome_azimuth,
+        dome_elevation,
+        shutters_percent_open,
+        cos_telescope_elevation,
+    ):
+        """Compute all four fields of the telescopeVignetted event.
+
+        The single implementation of the vignetting kernels; the public
+        ``compute_vignetted_by_*`` methods delegate to it, and
+        `report_vignetted_loop` calls it directly so one recompute pass
+        costs one frame and one set of attribute lookups.
+
+        The parameters mirror those of the per-axis methods; a `None`
+        input yields UNKNOWN for each field that needs it.
+
+        Returns
+        -------
+        vignetted_fields : `tuple`
+            A tuple (vignetted, azimuth, elevation, shutter) of
+            `TelescopeVignetted` values.
+        """
         if (
-            azimuth
-            == TelescopeVignetted.UNKNOWN
-            # or elevation == TelescopeVignetted.UNKNOWN
-            # TODO DM-39421 uncomment this once shutter info is available
-            # from the real MTDome.
-            # or shutter == TelescopeVignetted.UNKNOWN
-        ):
-            return TelescopeVignetted.UNKNOWN
-        elif (
-            azimuth
-            == TelescopeVignetted.NO
-            # and elevation == TelescopeVignetted.NO
-            # TODO DM-39421 uncomment this once shutter info is available
-            # from the real MTDome.
-            # and shutter == TelescopeVignetted.NO
-        ):
-            return TelescopeVignetted.NO
-        elif (
-            azimuth
-            == TelescopeVignetted.FULLY
-            # or elevation == TelescopeVignetted.FULLY
-            # TODO DM-39421 uncomment this once shutter info is available
-            # from the real MTDome.
-            # or shutter == TelescopeVignetted.FULLY
+            dome_azimuth is None
+            or telescope_azimuth is None
+            or cos_telescope_elevation is None
         ):
-            return TelescopeVignetted.FULLY
-        return TelescopeVignetted.PARTIALLY
+            azimuth = TelescopeVignetted.UNKNOWN
+        else:
+            scaled_abs_azimuth_difference = (
+                abs(wrap_diff_deg(dome_azimuth, telescope_azimuth))
+                * cos_telescope_elevation
+            )
+            if scaled_abs_azimuth_difference < self._azimuth_vignette_partial:
+                azimuth = TelescopeVignetted.NO
+            elif scaled_abs_azimuth_difference < self._azimuth_vignette_full:
+                azimuth = TelescopeVignetted.PARTIALLY
+            else:
+                azimuth = TelescopeVignetted.FULLY
+
+        if dome_elevation is None or telescope_elevation is None:
+            elevation = TelescopeVignetted.UNKNOWN
+        elif not self.enable_el_motion:
+            elevation = TelescopeVignetted.NO
+        else:
+            abs_elevation_difference = abs(
+                wrap_diff_deg(dome_elevation, telescope_elevation)
+            )
+            if abs_elevation_difference < self._elevation_vignette_partial:
+                elevation = TelescopeVignetted.NO
+            elif abs_elevation_difference < self._elevation_vignette_full:
+                elevation = TelescopeVignetted.PARTIALLY
+            else:
+                elevation = TelescopeVignetted.FULLY
+
+        if shutters_percent_open is None:
+            shutter = TelescopeVignetted.UNKNOWN
+        else:
+            shutter0 = shutters_percent_open[0]
+            shutter1 = shutters_percent_open[1]
+            # Both shutters clear the partial threshold iff the least-open
+            # one does; both are below the full threshold iff the most-open
+            # one is. This halves the subscripting and threshold compares.
+            least_open = shutter0 if shutter0 < shutter1 else shutter1
+            if least_open >= self._shutter_vignette_partial:
+                shutter = TelescopeVignetted.NO
+            else:
+                most_open = shutter0 if shutter0 > shutter1 else shutter1
+                if most_open <= self._shutter_vignette_full:
+                    shutter = TelescopeVignetted.FULLY
+                else:
+                    shutter = TelescopeVignetted.PARTIALLY
+
+        # TODO DM-39421: also fold in elevation and shutter, via
+        # max(VIGNETTED_RANK[azimuth], VIGNETTED_RANK[elevation],
+        # VIGNETTED_RANK[shutter]), once shutter info is available
+        # from the real MTDome.
+        vignetted = VIGNETTED_FROM_RANK[VIGNETTED_RANK[azimuth]]
+        return (vignetted, azimuth, elevation, shutter)
+
+    def compute_vignetted_by_any(self, *, azimuth, elevation, shutter):
+        """Compute the ``vignetted`` field of the telescopeVignetted event.
+
+        Combine the per-cause values by worst case, using
+        `VIGNETTED_RANK`; UNKNOWN ranks worst of all.
+        """
+        # TODO DM-39421: also fold in elevation and shutter, via
+        # max(VIGNETTED_RANK[azimuth], VIGNETTED_RANK[elevation],
+        # VIGNETTED_RANK[shutter]), once shutter info is available
+        # from the real MTDome.
+        return VIGNETTED_FROM_RANK[VIGNETTED_RANK[azimuth]]
 
     def compute_vignetted_by_azimuth(
-        self, dome_azimuth, telescope_azimuth, telescope_elevation
+        self, dome_azimuth, telescope_azimuth, cos_telescope_elevation
     ):
         """Compute the ``azimuth`` field of the telescopeVignetted event.
 
@@ -200,32 +447,24 @@ class MTDomeTrajectory(salobj.ConfigurableCsc):
             Dome current azimuth (deg); None if unknown.
         telescope_azimuth : `float` | None
             Telescope current azimuth (deg); None if unknown.
-        telescope_elevation : `float` | None
-            Telescope current elevation (deg); None if unknown.
+        cos_telescope_elevation : `float` | None
+            Cosine of the telescope current elevation; None if unknown.
+            Computed by the caller, so one recompute pass pays for
+            at most one cosine.
 
         Returns
         -------
         azimuth : `TelescopeVignetted`
             Telescope vignetted by azimuth mismatch between telescope and dome.
         """
-        if (
-            dome_azimuth is None
-            or telescope_azimuth is None
-            or telescope_elevation is None
-        ):
-            return TelescopeVignetted.UNKNOWN
-
-        abs_azimuth_difference = abs(
-            utils.angle_diff(dome_azimuth, telescope_azimuth).deg
-        )
-        scaled_abs_azimuth_difference = abs_azimuth_difference * math.cos(
-            math.radians(telescope_elevation)
-        )
-        if scaled_abs_azimuth_difference < self.config.azimuth_vignette_partial:
-            return TelescopeVignetted.NO
-        elif scaled_abs_azimuth_difference < self.config.azimuth_vignette_full:
-            return TelescopeVignetted.PARTIALLY
-        return TelescopeVignetted.FULLY
+        return self._compute_all_vignetted(
+            telescope_azimuth=telescope_azimuth,
+            telescope_elevation=None,
+            dome_azimuth=dome_azimuth,
+            dome_elevation=None,
+            shutters_percent_open=None,
+            cos_telescope_elevation=cos_telescope_elevation,
+        )[1]
 
     def compute_vignetted_by_elevation(self, dome_elevation, telescope_elevation):
         """Compute the ``elevation`` field of the telescopeVignetted event.
@@ -243,19 +482,14 @@ class MTDomeTrajectory(salobj.ConfigurableCsc):
             Telescope vignetted by elevation mismatch between telescope
             and dome.
         """
-        if dome_elevation is None or telescope_elevation is None:
-            return TelescopeVignetted.UNKNOWN
-        if self.enable_el_motion:
-            abs_elevation_difference = abs(
-                utils.angle_diff(dome_elevation, telescope_elevation).deg
-            )
-            if abs_elevation_difference < self.config.elevation_vignette_partial:
-                return TelescopeVignetted.NO
-            elif abs_elevation_difference < self.config.elevation_vignette_full:
-                return TelescopeVignetted.PARTIALLY
-            return TelescopeVignetted.FULLY
-        else:
-            return TelescopeVignetted.NO
+        return self._compute_all_vignetted(
+            telescope_azimuth=None,
+            telescope_elevation=telescope_elevation,
+            dome_azimuth=None,
+            dome_elevation=dome_elevation,
+            shutters_percent_open=None,
+            cos_telescope_elevation=None,
+        )[2]
 
     def compute_vignetted_by_shutter(self, shutters_percent_open):
         """Compute the ``shutter`` field of the telescopeVignetted event.
@@ -271,19 +505,14 @@ class MTDomeTrajectory(salobj.ConfigurableCsc):
             Telescope vignetted by dome shutter.
         """
 
-        if shutters_percent_open is None:
-            return TelescopeVignetted.UNKNOWN
-        if (
-            shutters_percent_open[0] >= self.config.shutter_vignette_partial
-            and shutters_percent_open[1] >= self.config.shutter_vignette_partial
-        ):
-            return TelescopeVignetted.NO
-        elif (
-            shutters_percent_open[0] <= self.config.shutter_vignette_full
-            and shutters_percent_open[1] <= self.config.shutter_vignette_full
-        ):
-            return TelescopeVignetted.FULLY
-        return TelescopeVignetted.PARTIALLY
+        return self._compute_all_vignetted(
+            telescope_azimuth=None,
+            telescope_elevation=None,
+            dome_azimuth=None,
+            dome_elevation=None,
+            shutters_percent_open=shutters_percent_open,
+            cos_telescope_elevation=None,
+        )[3]
 
     async def configure(self, config):
         """Configure this CSC and output the ``algorithm`` event.
@@ -294,20 +523,50 @@ class MTDomeTrajectory(salobj.ConfigurableCsc):
             Configuration, as described by `CONFIG_SCHEMA`
         """
         algorithm_name = config.algorithm_name
-        if algorithm_name not in AlgorithmRegistry:
+        algorithm_config = getattr(config, algorithm_name, None)
+        if algorithm_config is None:
             raise salobj.ExpectedError(f"Unknown algorithm {algorithm_name}.")
-        algorithm_config = getattr(config, config.algorithm_name)
-        self.algorithm = AlgorithmRegistry[config.algorithm_name](**algorithm_config)
+        try:
+            self.algorithm = make_algorithm(algorithm_name, algorithm_config)
+        except ValueError as e:
+            raise salobj.ExpectedError(str(e)) from e
+        self._desired_dome_elevation = self.algorithm.desired_dome_elevation
+        self._desired_dome_azimuth = self.algorithm.desired_dome_azimuth
+        self._desired_dome_axes = self.algorithm.desired_dome_axes
         self.config = config
         self.enable_el_motion = config.enable_el_motion
-        await self.evt_algorithm.set_write(
-            algorithmName=config.algorithm_name,
-            algorithmConfig=yaml.dump(algorithm_config),
-        )
+        # Plain-float copies of the vignetting thresholds, so the
+        # per-telemetry vignetting checks skip the config namespace
+        # lookups and never pay for mixed-type comparisons.
+        self._azimuth_vignette_partial = float(config.azimuth_vignette_partial)
+        self._azimuth_vignette_full = float(config.azimuth_vignette_full)
+        self._elevation_vignette_partial = float(config.elevation_vignette_partial)
+        self._elevation_vignette_full = float(config.elevation_vignette_full)
+        self._shutter_vignette_partial = float(config.shutter_vignette_partial)
+        self._shutter_vignette_full = float(config.shutter_vignette_full)
+        # Cache the dumped algorithm configuration, keyed on its items,
+        # so reconfiguring with the same values skips the YAML emitter.
+        config_key = (algorithm_name, tuple(sorted(algorithm_config.items())))
+        algorithm_config_yaml = self._config_yaml_cache.get(config_key)
+        if algorithm_config_yaml is None:
+            algorithm_config_yaml = yaml.dump(algorithm_config, Dumper=YAML_DUMPER)
+            self._config_yaml_cache[config_key] = algorithm_config_yaml
+        # Skip the write when reconfigured with unchanged values;
+        # salobj would deduplicate the publish, but only after
+        # comparing the full payload.
+        evt_algorithm = self.evt_algorithm
+        if (
+            not evt_algorithm.has_data
+            or evt_algorithm.data.algorithmName != algorithm_name
+            or evt_algorithm.data.algorithmConfig != algorithm_config_yaml
+        ):
+            await evt_algorithm.set_write(
+                algorithmName=algorithm_name,
+                algorithmConfig=algorithm_config_yaml,
+            )
 
     async def close_tasks(self):
-        self.move_dome_azimuth_task.cancel()
-        self.move_dome_elevation_task.cancel()
+        self._cancel_axis_moves()
         self.report_vignetted_task.cancel()
         await self.evt_telescopeVignetted.set_write(
             vignetted=TelescopeVignetted.UNKNOWN,
@@ -316,129 +575,237 @@ class MTDomeTrajectory(salobj.ConfigurableCsc):
         )
         await super().close_tasks()
 
-    def get_dome_target_elevation(self):
-        """Get the current dome elevation target."""
-        target = self.dome_remote.evt_elTarget.get()
+    def get_dome_target_elevation(self, tai=None):
+        """Get the current dome elevation target.
+
+        Parameters
+        ----------
+        tai : `float`, optional
+            TAI date (unix seconds) at which to report the target;
+            current TAI if None.
+        """
+        target = self._get_dome_el_target()
         if target is None:
             return None
-        if math.isnan(target.position):
+        position = target.position
+        if position != position:  # NaN check without a function call
             return None
-        return simactuators.path.PathSegment(
+        if tai is None:
+            tai = utils.current_tai()
+        cached_target, segment = self._el_target_cache
+        if target is cached_target:
+            segment.tai = tai
+            return segment
+        segment = PathSegment(
             position=target.position,
             velocity=target.velocity,
-            tai=utils.current_tai(),
+            tai=tai,
         )
+        self._el_target_cache = (target, segment)
+        return segment
+
+    def get_dome_target_azimuth(self, tai=None):
+        """Get the current dome azimuth target.
 
-    def get_dome_target_azimuth(self):
-        """Get the current dome azimuth target."""
-        target = self.dome_remote.evt_azTarget.get()
+        Parameters
+        ----------
+        tai : `float`, optional
+            TAI date (unix seconds) at which to report the target;
+            current TAI if None.
+        """
+        target = self._get_dome_az_target()
         if target is None:
             return None
-        if math.isnan(target.position):
+        position = target.position
+        if position != position:  # NaN check without a function call
             return None
-        return simactuators.path.PathSegment(
+        if tai is None:
+            tai = utils.current_tai()
+        cached_target, segment = self._az_target_cache
+        if target is cached_target:
+            segment.tai = tai
+            return segment
+        segment = PathSegment(
             position=target.position,
             velocity=target.velocity,
-            tai=utils.current_tai(),
+            tai=tai,
         )
+        self._az_target_cache = (target, segment)
+        return segment
 
     def get_dome_azimuth(self):
         """Get current actual dome azimuth (deg), or None if unavailable."""
-        azimuth_data = self.dome_remote.tel_azimuth.get()
+        azimuth_data = self._get_dome_azimuth_data()
         return None if azimuth_data is None else azimuth_data.positionActual
 
     def get_dome_elevation(self):
         """Get current actual dome elevation (deg), or None if unavailable."""
-        elevation_data = self.dome_remote.tel_lightWindScreen.get()
+        elevation_data = self._get_dome_elevation_data()
         return None if elevation_data is None else elevation_data.positionActual
 
     def get_shutters_percent_open(self):
         """Get the current open percentage of both shutters, or None
         if unavailable.
         """
-        shutter_data = self.dome_remote.tel_apertureShutter.get()
+        shutter_data = self._get_shutter_data()
         return None if shutter_data is None else shutter_data.positionActual
 
     def get_dome_summary_state(self):
         """Get MTDome summary state, or None if unavailable."""
-        dome_state = self.dome_remote.evt_summaryState.get()
+        dome_state = self._get_dome_state_data()
         return None if dome_state is None else dome_state.summaryState
 
     def get_telescope_azimuth(self):
         """Get current telescope azimuth (deg), or None if unavailable."""
-        azimuth_data = self.mtmount_remote.tel_azimuth.get()
+        azimuth_data = self._get_telescope_azimuth_data()
         return None if azimuth_data is None else azimuth_data.actualPosition
 
     def get_telescope_elevation(self):
         """Get current telescope elevation (deg), or None if unavailable."""
-        elevation_data = self.mtmount_remote.tel_elevation.get()
+        elevation_data = self._get_telescope_elevation_data()
         return None if elevation_data is None else elevation_data.actualPosition
 
     def get_telescope_summary_state(self):
         """Get MTMount summary state, or None if unavailable."""
-        telescope_state = self.mtmount_remote.evt_summaryState.get()
+        telescope_state = self._get_telescope_state_data()
         return None if telescope_state is None else telescope_state.summaryState
 
     async def handle_summary_state(self):
         if not self.summary_state == salobj.State.ENABLED:
-            self.move_dome_azimuth_task.cancel()
-            self.move_dome_elevation_task.cancel()
-            self.report_vignetted_task.cancel()
-            await self.evt_followingMode.set_write(enabled=False)
+            self._following_enabled = False
+            self._cancel_axis_moves()
+            # Skip the write if following mode is already reported
+            # as disabled; this runs on every state transition.
+            followingMode = self.evt_followingMode
+            if not followingMode.has_data or followingMode.data.enabled:
+                await followingMode.set_write(enabled=False)
         if self.disabled_or_enabled:
+            await self._ensure_remotes()
+            # Not done means the loop is alive from a previous DISABLED
+            # or ENABLED state and is simply kept running; it is only
+            # cancelled (below) when leaving both states.
             if self.report_vignetted_task.done():
                 self.report_vignetted_task = asyncio.create_task(
                     self.report_vignetted_loop()
                 )
         else:
             self.report_vignetted_task.cancel()
+            # Wait for the cancellation to finish, so a later transition
+            # back to DISABLED/ENABLED sees a done task and restarts
+            # the loop.
+            try:
+                await self.report_vignetted_task
+            except asyncio.CancelledError:
+                pass
             await self.evt_telescopeVignetted.set_write(
                 vignetted=TelescopeVignetted.UNKNOWN,
                 azimuth=TelescopeVignetted.UNKNOWN,
                 shutter=TelescopeVignetted.UNKNOWN,
             )
 
+    async def _vignetting_input_callback(self, data):
+        """Callback for every topic that feeds the telescopeVignetted event.
+
+        The data has already been stored on its topic; just wake
+        `report_vignetted_loop`.
+        """
+        self._vignetting_event.set()
+
     async def report_vignetted_loop(self):
-        """Poll MTDome & MTMount topics to report telescopeVignetted event."""
+        """Report the telescopeVignetted event whenever an input changes.
+
+        Publish once on startup, then wait until one of the MTDome or
+        MTMount topics that feed the event sees new data; the published
+        event itself is deduplicated by set_write.
+        """
         self.log.info("report_vignetted_loop begins.")
         ok_states = frozenset((salobj.State.DISABLED, salobj.State.ENABLED))
+        # Bound topic getters, hoisted so each read below is one call
+        # with no getter-method frame; _ensure_remotes has already run.
+        get_dome_state_data = self._get_dome_state_data
+        get_telescope_state_data = self._get_telescope_state_data
+        get_telescope_azimuth_data = self._get_telescope_azimuth_data
+        get_telescope_elevation_data = self._get_telescope_elevation_data
+        get_dome_azimuth_data = self._get_dome_azimuth_data
+        get_dome_elevation_data = self._get_dome_elevation_data
+        get_shutter_data = self._get_shutter_data
         try:
+            last_sig = ()
             while True:
-                dome_state = self.get_dome_summary_state()
-                telescope_state = self.get_telescope_summary_state()
-                if dome_state not in ok_states or telescope_state not in ok_states:
-                    azimuth = TelescopeVignetted.UNKNOWN
-                    elevation = TelescopeVignetted.UNKNOWN
-                    shutter = TelescopeVignetted.UNKNOWN
+                # Clear before reading the inputs, so anything arriving
+                # during the recompute triggers another pass.
+                self._vignetting_event.clear()
+                dome_state_data = get_dome_state_data()
+                telescope_state_data = get_telescope_state_data()
+                states_ok = (
+                    dome_state_data is not None
+                    and dome_state_data.summaryState in ok_states
+                    and telescope_state_data is not None
+                    and telescope_state_data.summaryState in ok_states
+                )
+                if states_ok:
+                    data = get_telescope_azimuth_data()
+                    telescope_azimuth = None if data is None else data.actualPosition
+                    data = get_telescope_elevation_data()
+                    telescope_elevation = None if data is None else data.actualPosition
+                    data = get_dome_azimuth_data()
+                    dome_azimuth = None if data is None else data.positionActual
+                    data = get_dome_elevation_data()
+                    dome_elevation = None if data is None else data.positionActual
+                    data = get_shutter_data()
+                    shutters_percent_open = (
+                        None if data is None else data.positionActual
+                    )
+                    sig = (
+                        telescope_azimuth,
+                        telescope_elevation,
+                        dome_azimuth,
+                        dome_elevation,
+                        (
+                            None
+                            if shutters_percent_open is None
+                            else (shutters_percent_open[0], shutters_percent_open[1])
+                        ),
+                    )
                 else:
-                    telescope_azimuth = self.get_telescope_azimuth()
-                    telescope_elevation = self.get_telescope_elevation()
-                    dome_azimuth = self.get_dome_azimuth()
-                    dome_elevation = self.get_dome_elevation()
-                    shutters_percent_open = self.get_shutters_percent_open()
-                    azimuth = self.compute_vignetted_by_azimuth(
-                        dome_azimuth=dome_azimuth,
+                    sig = None
+                if sig == last_sig:
+                    # Repeated values; the result cannot have changed.
+                    await self._vignetting_event.wait()
+                    continue
+                last_sig = sig
+
+                if states_ok:
+                    cos_telescope_elevation = (
+                        None
+                        if telescope_elevation is None
+                        else math.cos(telescope_elevation * RAD_PER_DEG)
+                    )
+                    (
+                        vignetted,
+                        azimuth,
+                        elevation,
+                        shutter,
+                    ) = self._compute_all_vignetted(
                         telescope_azimuth=telescope_azimuth,
                         telescope_elevation=telescope_elevation,
-                    )
-                    elevation = self.compute_vignetted_by_elevation(
+                        dome_azimuth=dome_azimuth,
                         dome_elevation=dome_elevation,
-                        telescope_elevation=telescope_elevation,
-                    )
-                    shutter = self.compute_vignetted_by_shutter(
-                        shutters_percent_open=shutters_percent_open
+                        shutters_percent_open=shutters_percent_open,
+                        cos_telescope_elevation=cos_telescope_elevation,
                     )
-
-                vignetted = self.compute_vignetted_by_any(
-                    azimuth=azimuth, elevation=elevation, shutter=shutter
-                )
+                else:
+                    vignetted = TelescopeVignetted.UNKNOWN
+                    azimuth = TelescopeVignetted.UNKNOWN
+                    elevation = TelescopeVignetted.UNKNOWN
+                    shutter = TelescopeVignetted.UNKNOWN
                 await self.evt_telescopeVignetted.set_write(
                     vignetted=vignetted,
                     azimuth=azimuth,
                     elevation=elevation,
                     shutter=shutter,
                 )
-                await asyncio.sleep(VIGNETTING_MONITOR_INTERVAL)
+                await self._vignetting_event.wait()
         except asyncio.CancelledError:
             self.log.info("report_vignetted_loop ends.")
         except Exception:
@@ -454,22 +821,40 @@ class MTDomeTrajectory(salobj.ConfigurableCsc):
 
         This is triggered in any summary state, but only
         commands a new dome position if enabled.
+
+        Events whose position and velocity match the previous event
+        are ignored; they could not result in a new dome position.
         """
+        sig = (
+            target.elevation,
+            target.azimuth,
+            target.elevationVelocity,
+            target.azimuthVelocity,
+        )
+        if sig == self._last_target_sig:
+            return
+        self._last_target_sig = sig
         telescope_target = ElevationAzimuth(
-            elevation=simactuators.path.PathSegment(
+            elevation=PathSegment(
                 position=target.elevation,
                 velocity=target.elevationVelocity,
                 tai=target.taiTime,
             ),
             # Make sure that the target angle is in the range [0, 360).
-            azimuth=simactuators.path.PathSegment(
-                position=utils.angle_wrap_nonnegative(target.azimuth).deg,
+            # Python % returns a nonnegative result for a positive
+            # divisor, so this matches utils.angle_wrap_nonnegative
+            # without constructing an Angle per event.
+            azimuth=PathSegment(
+                position=target.azimuth % 360.0,
                 velocity=target.azimuthVelocity,
                 tai=target.taiTime,
             ),
         )
         self.telescope_target = telescope_target
-        await self.follow_target()
+        # Hoist follow_target's cheap guards, so a target event seen
+        # while not following costs no follow_target coroutine.
+        if self.following_enabled and self.start_task.done():
+            await self.follow_target()
 
     async def follow_target(self):
         """Send the dome to a new position, if appropriate.
@@ -482,68 +867,205 @@ class MTDomeTrajectory(salobj.ConfigurableCsc):
             return
         if not self.start_task.done():
             return
+        if self.dome_remote is None:
+            return
         if self.telescope_target is None:
             return
         moved_elevation = False
         moved_azimuth = False
 
-        if (
+        # One clock read per update, shared by both axes,
+        # so the two target segments get a consistent timestamp.
+        tai = utils.current_tai()
+
+        # Compute the desired position for each axis first,
+        # then create the move tasks back to back, so both moves
+        # are scheduled in the same event loop pass.
+        # When both axes are eligible, use the fused desired_dome_axes
+        # entry point so the algorithm is dispatched once.
+        desired_dome_elevation = None
+        desired_dome_azimuth = None
+        telescope_target = self.telescope_target
+        next_telescope_target = self.next_telescope_target
+
+        compute_elevation = (
             self.move_dome_elevation_task.done()
-            and self.dome_remote.evt_elMotion.has_data
+            and self._dome_el_motion.has_data
             and self.enable_el_motion
-        ):
-            dome_target_elevation = self.get_dome_target_elevation()
-            desired_dome_elevation = self.algorithm.desired_dome_elevation(
-                dome_target_elevation=dome_target_elevation,
-                telescope_target=self.telescope_target,
-                next_telescope_target=self.next_telescope_target,
+        )
+        compute_azimuth = (
+            self.move_dome_azimuth_task.done() and self._dome_az_motion.has_data
+        )
+
+        if compute_elevation and compute_azimuth:
+            desired_dome_elevation, desired_dome_azimuth = self._desired_dome_axes(
+                dome_target_elevation=self.get_dome_target_elevation(tai),
+                dome_target_azimuth=self.get_dome_target_azimuth(tai),
+                telescope_target=telescope_target,
+                next_telescope_target=next_telescope_target,
+            )
+        elif compute_elevation:
+            desired_dome_elevation = self._desired_dome_elevation(
+                dome_target_elevation=self.get_dome_target_elevation(tai),
+                telescope_target=telescope_target,
+                next_telescope_target=next_telescope_target,
             )
-            if desired_dome_elevation is not None and math.isfinite(
+        elif compute_azimuth:
+            desired_dome_azimuth = self._desired_dome_azimuth(
+                dome_target_azimuth=self.get_dome_target_azimuth(tai),
+                telescope_target=telescope_target,
+                next_telescope_target=next_telescope_target,
+            )
+
+        if compute_elevation:
+            if desired_dome_elevation is not None and not math.isfinite(
                 desired_dome_elevation.position
             ):
-                moved_elevation = True
-                self.move_dome_elevation_task = asyncio.create_task(
-                    self.move_dome_elevation(desired_dome_elevation)
-                )
-            else:
+                desired_dome_elevation = None
+            if desired_dome_elevation is None:
                 self.log.warning(
                     f"{desired_dome_elevation=} too small or invalid; not moving the dome elevation."
                 )
 
-        if (
-            self.move_dome_azimuth_task.done()
-            and self.dome_remote.evt_azMotion.has_data
-        ):
-            dome_target_azimuth = self.get_dome_target_azimuth()
-            desired_dome_azimuth = self.algorithm.desired_dome_azimuth(
-                dome_target_azimuth=dome_target_azimuth,
-                telescope_target=self.telescope_target,
-                next_telescope_target=self.next_telescope_target,
-            )
-            if (
-                desired_dome_azimuth is not None
-                and math.isfinite(desired_dome_azimuth.position)
+        if compute_azimuth:
+            if desired_dome_azimuth is not None and not (
+                math.isfinite(desired_dome_azimuth.position)
                 and math.isfinite(desired_dome_azimuth.velocity)
             ):
-                moved_azimuth = True
-                self.move_dome_azimuth_task = asyncio.create_task(
-                    self.move_dome_azimuth(desired_dome_azimuth)
-                )
-            else:
+                desired_dome_azimuth = None
+            if desired_dome_azimuth is None:
                 self.log.warning(
                     f"{desired_dome_azimuth=} too small or invalid; not moving the dome azimuth."
                 )
 
-        if not self.follow_task.done():
+        if desired_dome_elevation is not None:
+            moved_elevation = True
+            # Also restart the worker if a cancellation is pending but
+            # not yet processed; such a worker drains its queue when it
+            # dies and would drop the move queued below.
+            worker_task = self._elevation_worker_task
+            if worker_task.done() or worker_task.cancelling():
+                self._elevation_worker_task = asyncio.create_task(
+                    self._axis_move_worker(self._elevation_move_queue)
+                )
+            self.move_dome_elevation_task = self._queue_axis_move(
+                self._elevation_move_queue,
+                self.move_dome_elevation(desired_dome_elevation),
+            )
+        if desired_dome_azimuth is not None:
+            moved_azimuth = True
+            worker_task = self._azimuth_worker_task
+            if worker_task.done() or worker_task.cancelling():
+                self._azimuth_worker_task = asyncio.create_task(
+                    self._axis_move_worker(self._azimuth_move_queue)
+                )
+            self.move_dome_azimuth_task = self._queue_axis_move(
+                self._azimuth_move_queue,
+                self.move_dome_azimuth(desired_dome_azimuth),
+            )
+
+        self.last_follow_result = (moved_elevation, moved_azimuth)
+        self.follow_event.set()
+        if self.follow_task is not None and not self.follow_task.done():
             self.follow_task.set_result((moved_elevation, moved_azimuth))
 
+    async def _axis_move_worker(self, queue):
+        """Run queued moves for one dome axis, one at a time.
+
+        A long-lived coroutine, so follow_target does not create
+        a new task per move. Each queue item is a (move coroutine, future)
+        pair queued by `_queue_axis_move`; the future is set done
+        when the move coroutine finishes.
+
+        Parameters
+        ----------
+        queue : `asyncio.Queue`
+            The move queue for this axis.
+
+        When cancelled, drain the queue, so a move queued between the
+        cancellation request and this coroutine processing it is
+        cancelled rather than left pending with no worker to run it.
+        """
+        while True:
+            try:
+                move_coro, future = await queue.get()
+            except asyncio.CancelledError:
+                self._drain_move_queue(queue)
+                raise
+            if future.done():
+                move_coro.close()
+                continue
+            try:
+                await move_coro
+            except asyncio.CancelledError:
+                future.cancel()
+                self._drain_move_queue(queue)
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(None)
+
+    def _queue_axis_move(self, queue, move_coro):
+        """Queue a dome axis move, dropping any queued move
+        that has not started yet.
+
+        Parameters
+        ----------
+        queue : `asyncio.Queue`
+            The move queue for this axis.
+        move_coro : coroutine
+            The `move_dome_elevation` or `move_dome_azimuth` coroutine
+            to run.
+
+        Returns
+        -------
+        future : `asyncio.Future`
+            Future that is set done when the move coroutine finishes.
+        """
+        if queue.full():
+            stale_coro, stale_future = queue.get_nowait()
+            stale_coro.close()
+            stale_future.cancel()
+        future = asyncio.get_running_loop().create_future()
+        queue.put_nowait((move_coro, future))
+        return future
+
+    @staticmethod
+    def _drain_move_queue(queue):
+        """Close and cancel every queued (move coroutine, future) pair."""
+        while not queue.empty():
+            move_coro, future = queue.get_nowait()
+            move_coro.close()
+            future.cancel()
+
+    def _cancel_axis_moves(self):
+        """Cancel all queued and in-flight dome axis moves.
+
+        Cancel the workers as well, to interrupt an in-flight move;
+        follow_target restarts them on demand.
+        """
+        self.move_dome_azimuth_task.cancel()
+        self.move_dome_elevation_task.cancel()
+        self._drain_move_queue(self._elevation_move_queue)
+        self._drain_move_queue(self._azimuth_move_queue)
+        self._elevation_worker_task.cancel()
+        self._azimuth_worker_task.cancel()
+
     def make_follow_task(self):
         """Make and return a task that is set when the follow method runs.
 
         The result of the task is (moved_elevation, moved_azimuth).
         This method is intended for unit tests.
+
+        Also clear the target-event signature, so the next MTMount
+        target event is handled even if it repeats the previous one.
         """
-        self.follow_task = asyncio.Future()
+        self._last_target_sig = None
+        self.follow_event.clear()
+        self.follow_task = asyncio.get_running_loop().create_future()
         return self.follow_task
 
     async def move_dome_elevation(self, desired_dome_elevation):
@@ -559,30 +1081,13 @@ class MTDomeTrajectory(salobj.ConfigurableCsc):
         desired_dome_elevation : `lsst.ts.simactuators.path.PathSegment`
             Desired dome elevation. The velocity is ignored.
         """
-        try:
-            dome_el_motion_state = self.dome_remote.evt_elMotion.get()
-            if dome_el_motion_state is None:
-                self.log.warning(
-                    "No data for Dome elMotion event; not moving the dome elevation."
-                )
-                return
-
-            # Move the dome elevation axis and wait for the target event
-            # and the first motion event (so motion has started).
-            self.dome_remote.evt_elTarget.flush()
-            self.log.debug(
-                f"Start dome elevation motion with {desired_dome_elevation.position=}."
-            )
-            await self.dome_remote.cmd_moveEl.set_start(
-                position=desired_dome_elevation.position,
-                timeout=STD_TIMEOUT,
-            )
-            await self.dome_remote.evt_elTarget.next(flush=False, timeout=STD_TIMEOUT)
-        except asyncio.CancelledError:
-            raise
-        except Exception:
-            self.log.exception("Failed to move dome in elevation.")
-            raise
+        await self._move_dome_axis(
+            axis_name="elevation",
+            motion_event=self._dome_el_motion,
+            target_event=self._dome_el_target,
+            move_command=self._dome_cmd_move_el,
+            command_kwargs=dict(position=desired_dome_elevation.position),
+        )
 
     async def move_dome_azimuth(self, desired_dome_azimuth):
         """Start moving the dome azimuth axis.
@@ -597,37 +1102,74 @@ class MTDomeTrajectory(salobj.ConfigurableCsc):
         desired_dome_azimuth : `lsst.ts.simactuators.path.PathSegment`
             Desired dome azimuth.
         """
+        await self._move_dome_axis(
+            axis_name="azimuth",
+            motion_event=self._dome_az_motion,
+            target_event=self._dome_az_target,
+            move_command=self._dome_cmd_move_az,
+            command_kwargs=dict(
+                position=desired_dome_azimuth.position,
+                velocity=desired_dome_azimuth.velocity,
+            ),
+        )
+
+    async def _move_dome_axis(
+        self, axis_name, motion_event, target_event, move_command, command_kwargs
+    ):
+        """Start moving one dome axis.
+
+        Wait until the dome has reported that it is moving,
+        via the motion and target events for the axis.
+
+        This will log a warning and return if the motion event has no data.
+
+        Parameters
+        ----------
+        axis_name : `str`
+            Axis name for log messages: "elevation" or "azimuth".
+        motion_event : `lsst.ts.salobj.topics.RemoteEvent`
+            Motion event for the axis: evt_elMotion or evt_azMotion.
+        target_event : `lsst.ts.salobj.topics.RemoteEvent`
+            Target event for the axis: evt_elTarget or evt_azTarget.
+        move_command : `lsst.ts.salobj.topics.RemoteCommand`
+            Move command for the axis: cmd_moveEl or cmd_moveAz.
+        command_kwargs : `dict`
+            Arguments for the move command.
+        """
         try:
-            dome_az_motion_state = self.dome_remote.evt_azMotion.get()
-            if dome_az_motion_state is None:
+            if motion_event.get() is None:
                 self.log.warning(
-                    "No data for the Dome azMotion event; not moving the dome azimuth."
+                    f"No data for the Dome {axis_name} motion event; "
+                    f"not moving the dome {axis_name}."
                 )
                 return
 
-            # Move the dome azimuth axis and wait for the target event
+            # Move the dome axis and wait for the target event
             # and the first motion event (so motion has started).
-            self.dome_remote.evt_azTarget.flush()
-            self.log.debug(
-                "Start dome azimuth motion with "
-                f"{desired_dome_azimuth.position=} and {desired_dome_azimuth.velocity=}."
-            )
-            await self.dome_remote.cmd_moveAz.set_start(
-                position=desired_dome_azimuth.position,
-                velocity=desired_dome_azimuth.velocity,
-                timeout=STD_TIMEOUT,
+            target_event.flush()
+            self.log.debug(f"Start dome {axis_name} motion with {command_kwargs}.")
+            # Await the command acknowledgement and the target event
+            # concurrently; the event is published while the command
+            # runs, so waiting in sequence adds avoidable latency.
+            await asyncio.gather(
+                move_command.set_start(**command_kwargs, timeout=STD_TIMEOUT),
+                target_event.next(flush=False, timeout=STD_TIMEOUT),
             )
-            await self.dome_remote.evt_azTarget.next(flush=False, timeout=STD_TIMEOUT)
         except asyncio.CancelledError:
             raise
         except Exception:
-            self.log.exception("Failed to move dome in azimuth.")
+            self.log.exception(f"Failed to move dome in {axis_name}.")
             raise
 
-    async def start(self):
-        await super().start()
-        await self.dome_remote.start_task
-
 
 def run_mtdometrajectory():
+    # Use uvloop, if available, for lower event-loop latency.
+    # Installed only here, in the service entry point, so importing
+    # this package (e.g. in tests) keeps the stock event loop.
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        uvloop.install()
     asyncio.run(MTDomeTrajectory.amain(index=None))
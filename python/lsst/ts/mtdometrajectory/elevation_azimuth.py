@@ -19,7 +19,17 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-__all__ = ["ElevationAzimuth"]
+__all__ = ["ElevationAzimuth", "wrap_diff_deg"]
+
+
+def wrap_diff_deg(angle1, angle2):
+    """Return angle1 - angle2 (deg) wrapped into [-180, 180).
+
+    Equivalent to ``lsst.ts.utils.angle_diff(angle1, angle2).deg``
+    for finite inputs, but pure float arithmetic with no Angle
+    allocation, for use on per-event paths.
+    """
+    return (angle1 - angle2 + 180.0) % 360.0 - 180.0
 
 
 class ElevationAzimuth:
@@ -33,6 +43,10 @@ class ElevationAzimuth:
         Azimuth position (deg) and velocity at a specified TAI time.
     """
 
+    # One instance is allocated per MTMount target event;
+    # slots avoid a per-instance __dict__.
+    __slots__ = ("elevation", "azimuth")
+
     def __init__(self, elevation, azimuth):
         self.elevation = elevation
         self.azimuth = azimuth
@@ -26,6 +26,16 @@ import asyncio
 from lsst.ts import salobj, simactuators, utils
 from lsst.ts.xml.enums.MTDome import MotionState
 
+# MotionState members used on the command and event paths,
+# bound once to avoid repeated enum attribute lookups.
+MOVING = MotionState.MOVING
+STOPPED = MotionState.STOPPED
+CRAWLING = MotionState.CRAWLING
+
+# End state of an azimuth move, indexed by whether the dome
+# keeps crawling (i.e. the commanded velocity is nonzero).
+END_STATE_BY_CRAWLING = (STOPPED, CRAWLING)
+
 
 class MockDome(salobj.BaseCsc):
     """A very limited fake Dome CSC
@@ -51,21 +61,25 @@ class MockDome(salobj.BaseCsc):
         initial_state,
         initial_elevation=0,
     ):
-        self.elevation_actuator = simactuators.PointToPointActuator(
-            min_position=0,
-            max_position=90,
-            speed=20,
-            start_position=initial_elevation,
-        )
-        self.azimuth_actuator = simactuators.CircularTrackingActuator(
-            max_velocity=20,
-            max_acceleration=10,
-            dtmax_track=0,
-        )
+        # The axis actuators are built lazily by _ensure_actuators
+        # on the first transition to DISABLED or ENABLED,
+        # so a CSC that stays in STANDBY never pays for them.
+        self.initial_elevation = initial_elevation
+        self.elevation_actuator = None
+        self.azimuth_actuator = None
         self.telemetry_interval = 0.2  # seconds
+        # Telemetry is re-published after this many unchanged cycles,
+        # so subscribers can still detect liveness while the dome idles.
+        self.telemetry_heartbeat_cycles = 5
         self.telemetry_loop_task = utils.make_done_future()
+        # Futures that are set done when the current move ends,
+        # resolved by the event write that the timers below trigger.
         self.elevation_done_task = utils.make_done_future()
         self.azimuth_done_task = utils.make_done_future()
+        # Timer handles that fire when the current move should end;
+        # a TimerHandle costs far less than a task sleeping out the move.
+        self.elevation_done_timer = None
+        self.azimuth_done_timer = None
         super().__init__(
             name="MTDome",
             index=None,
@@ -73,20 +87,39 @@ class MockDome(salobj.BaseCsc):
             allow_missing_callbacks=True,
         )
 
+    def _ensure_actuators(self):
+        """Create the axis actuators, if not already created."""
+        if self.elevation_actuator is not None:
+            return
+        self.elevation_actuator = simactuators.PointToPointActuator(
+            min_position=0,
+            max_position=90,
+            speed=20,
+            start_position=self.initial_elevation,
+        )
+        self.azimuth_actuator = simactuators.CircularTrackingActuator(
+            max_velocity=20,
+            max_acceleration=10,
+            dtmax_track=0,
+        )
+
     async def start(self):
         await super().start()
         await self.evt_azMotion.set_write(
-            state=MotionState.STOPPED,
+            state=STOPPED,
             inPosition=False,
         )
         await self.evt_elMotion.set_write(
-            state=MotionState.STOPPED,
+            state=STOPPED,
             inPosition=False,
         )
 
     async def close_tasks(self):
         await super().close_tasks()
         self.telemetry_loop_task.cancel()
+        for timer in (self.elevation_done_timer, self.azimuth_done_timer):
+            if timer is not None:
+                timer.cancel()
 
     def get_target_elevation(self):
         """Get the target elevation as an
@@ -111,100 +144,217 @@ class MockDome(salobj.BaseCsc):
             position=data.position, velocity=0, force_output=True
         )
         await self.evt_elMotion.set_write(
-            state=MotionState.MOVING,
+            state=MOVING,
             inPosition=False,
         )
-        self.elevation_done_task = asyncio.create_task(
-            self.report_elevation_done(
-                in_position=True, motion_state=MotionState.STOPPED
+        duration = self.elevation_actuator.remaining_time()
+        if duration > 0:
+            self._schedule_elevation_done(
+                duration=duration, in_position=True, motion_state=STOPPED
+            )
+        else:
+            # Zero-duration move: report done inline rather than paying
+            # for a task that would finish on its first step.
+            await self.evt_elMotion.set_write(
+                state=STOPPED,
+                inPosition=True,
             )
-        )
 
     async def do_moveAz(self, data):
         self.assert_enabled()
+        tai = utils.current_tai()
         self.azimuth_actuator.set_target(
             position=data.position,
             velocity=data.velocity,
-            tai=utils.current_tai(),
+            tai=tai,
         )
         await self.evt_azTarget.set_write(
             position=data.position, velocity=data.velocity, force_output=True
         )
         await self.evt_azMotion.set_write(
-            state=MotionState.MOVING,
+            state=MOVING,
             inPosition=False,
         )
-        end_motion_state = (
-            MotionState.CRAWLING if data.velocity != 0 else MotionState.STOPPED
-        )
-        self.azimuth_done_task = asyncio.create_task(
-            self.report_azimuth_done(in_position=True, motion_state=end_motion_state)
-        )
+        end_motion_state = END_STATE_BY_CRAWLING[data.velocity != 0]
+        end_tai = self.azimuth_actuator.path.segments[-1].tai
+        duration = end_tai - tai
+        if duration > 0:
+            self._schedule_azimuth_done(
+                duration=duration, in_position=True, motion_state=end_motion_state
+            )
+        else:
+            # Zero-duration move: report done inline rather than paying
+            # for a task that would finish on its first step.
+            await self.evt_azMotion.set_write(
+                state=end_motion_state,
+                inPosition=True,
+            )
 
     async def handle_summary_state(self):
         if self.disabled_or_enabled:
+            self._ensure_actuators()
             if self.telemetry_loop_task.done():
                 self.telemetry_loop_task = asyncio.create_task(self.telemetry_loop())
         else:
             self.telemetry_loop_task.cancel()
 
-    async def report_azimuth_done(self, in_position, motion_state):
-        """Wait for azimuth to stop moving and report evt_azMotion.
+    def _schedule_azimuth_done(self, duration, in_position, motion_state):
+        """Schedule reporting evt_azMotion at the end of an azimuth move.
 
         Parameters
         ----------
+        duration : `float`
+            Remaining duration of the move (seconds); must be positive.
         in_position : `bool`
             Is the axis in position at the end of the move?
         motion_state : `lsst.ts.xml.MotionState`
             Motion state at end of move.
         """
-        end_tai = self.azimuth_actuator.path.segments[-1].tai
-        duration = end_tai - utils.current_tai()
-        if duration > 0:
-            await asyncio.sleep(duration)
-        await self.evt_azMotion.set_write(
-            state=motion_state,
-            inPosition=in_position,
+        if self.azimuth_done_timer is not None:
+            self.azimuth_done_timer.cancel()
+        if not self.azimuth_done_task.done():
+            # Superseded move; release any awaiters.
+            self.azimuth_done_task.cancel()
+        loop = asyncio.get_running_loop()
+        self.azimuth_done_task = loop.create_future()
+        self.azimuth_done_timer = loop.call_later(
+            duration,
+            self._start_axis_done_report,
+            self.evt_azMotion,
+            self.azimuth_done_task,
+            in_position,
+            motion_state,
         )
 
-    async def report_elevation_done(self, in_position, motion_state):
-        """Wait for elevation to stop moving and report it in position.
+    def _schedule_elevation_done(self, duration, in_position, motion_state):
+        """Schedule reporting evt_elMotion at the end of an elevation move.
 
         Parameters
         ----------
+        duration : `float`
+            Remaining duration of the move (seconds); must be positive.
         in_position : `bool`
             Is the axis in position at the end of the move?
         motion_state : `lsst.ts.xml.MotionState`
             Motion state at end of move.
         """
-        duration = self.elevation_actuator.remaining_time()
-        if duration > 0:
-            await asyncio.sleep(duration)
-        await self.evt_elMotion.set_write(
+        if self.elevation_done_timer is not None:
+            self.elevation_done_timer.cancel()
+        if not self.elevation_done_task.done():
+            # Superseded move; release any awaiters.
+            self.elevation_done_task.cancel()
+        loop = asyncio.get_running_loop()
+        self.elevation_done_task = loop.create_future()
+        self.elevation_done_timer = loop.call_later(
+            duration,
+            self._start_axis_done_report,
+            self.evt_elMotion,
+            self.elevation_done_task,
+            in_position,
+            motion_state,
+        )
+
+    def _start_axis_done_report(
+        self, motion_event, done_future, in_position, motion_state
+    ):
+        """Timer callback that reports the end of a move.
+
+        The event-write task is created only now, when the move ends,
+        instead of keeping a task alive for the whole move.
+        """
+        asyncio.ensure_future(
+            self._report_axis_done(motion_event, done_future, in_position, motion_state)
+        )
+
+    async def _report_axis_done(
+        self, motion_event, done_future, in_position, motion_state
+    ):
+        """Write a motion event marking the end of a move
+        and resolve the axis done future.
+        """
+        await motion_event.set_write(
             state=motion_state,
             inPosition=in_position,
         )
+        if not done_future.done():
+            done_future.set_result(None)
 
     async def telemetry_loop(self):
         try:
+            # Schedule against a monotonic deadline instead of sleeping
+            # a fixed interval after each publish, so the cadence does
+            # not drift by the publish duration.
+            loop = asyncio.get_running_loop()
+            interval = self.telemetry_interval
+            # Hoist attribute chains out of the steady-state loop body.
+            azimuth_actuator = self.azimuth_actuator
+            elevation_actuator = self.elevation_actuator
+            write_azimuth = self.tel_azimuth.set_write
+            write_light_wind_screen = self.tel_lightWindScreen.set_write
+            current_tai = utils.current_tai
+            gather = asyncio.gather
+            sleep = asyncio.sleep
+            loop_time = loop.time
+            heartbeat_cycles = self.telemetry_heartbeat_cycles
+            # Samples published most recently; a write is skipped while
+            # its sample repeats, except on heartbeat cycles.
+            last_azimuth_sample = None
+            last_light_wind_screen_sample = None
+            cycles_until_heartbeat = 0
+            next_tick = loop_time() + interval
             while True:
-                tai = utils.current_tai()
-                azimuth_target = self.azimuth_actuator.target.at(tai)
-                azimuth_actual = self.azimuth_actuator.path.at(tai)
-                await self.tel_azimuth.set_write(
-                    positionActual=azimuth_actual.position,
-                    positionCommanded=azimuth_target.position,
-                    velocityActual=azimuth_actual.velocity,
-                    velocityCommanded=azimuth_target.velocity,
+                tai = current_tai()
+                azimuth_target = azimuth_actuator.target.at(tai)
+                azimuth_actual = azimuth_actuator.path.at(tai)
+                azimuth_sample = (
+                    azimuth_actual.position,
+                    azimuth_target.position,
+                    azimuth_actual.velocity,
+                    azimuth_target.velocity,
                 )
-
-                await self.tel_lightWindScreen.set_write(
-                    positionActual=self.elevation_actuator.position(tai),
-                    positionCommanded=self.elevation_actuator.end_position,
-                    velocityActual=self.elevation_actuator.velocity(tai),
-                    velocityCommanded=0,
+                light_wind_screen_sample = (
+                    elevation_actuator.position(tai),
+                    elevation_actuator.end_position,
+                    elevation_actuator.velocity(tai),
                 )
-                await asyncio.sleep(self.telemetry_interval)
+                heartbeat = cycles_until_heartbeat <= 0
+                writes = []
+                if heartbeat or azimuth_sample != last_azimuth_sample:
+                    last_azimuth_sample = azimuth_sample
+                    writes.append(
+                        write_azimuth(
+                            positionActual=azimuth_sample[0],
+                            positionCommanded=azimuth_sample[1],
+                            velocityActual=azimuth_sample[2],
+                            velocityCommanded=azimuth_sample[3],
+                        )
+                    )
+                if heartbeat or light_wind_screen_sample != (
+                    last_light_wind_screen_sample
+                ):
+                    last_light_wind_screen_sample = light_wind_screen_sample
+                    writes.append(
+                        write_light_wind_screen(
+                            positionActual=light_wind_screen_sample[0],
+                            positionCommanded=light_wind_screen_sample[1],
+                            velocityActual=light_wind_screen_sample[2],
+                            velocityCommanded=0,
+                        )
+                    )
+                if writes:
+                    # Issue the writes concurrently; both samples are
+                    # evaluated at the same tai.
+                    await gather(*writes)
+                if heartbeat:
+                    cycles_until_heartbeat = heartbeat_cycles
+                else:
+                    cycles_until_heartbeat -= 1
+                now = loop_time()
+                if next_tick <= now:
+                    # Fell behind; skip the missed ticks.
+                    next_tick = now + interval
+                await sleep(next_tick - now)
+                next_tick += interval
         except asyncio.CancelledError:
             raise
         except Exception:
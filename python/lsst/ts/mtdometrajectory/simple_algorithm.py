@@ -23,9 +23,10 @@ __all__ = ["SimpleAlgorithm"]
 
 import math
 
-from lsst.ts import salobj, simactuators, utils
+from lsst.ts import salobj, simactuators
 
 from . import base_algorithm
+from .elevation_azimuth import wrap_diff_deg
 
 RAD_PER_DEG = math.pi / 180
 
@@ -67,18 +68,25 @@ class SimpleAlgorithm(base_algorithm.BaseAlgorithm):
         if dome_target_elevation is None:
             return telescope_target.elevation
 
-        dome_elevation_shifted = dome_target_elevation.at(
-            telescope_target.elevation.tai
+        # Inline dome_target_elevation.at(tai) and the angle wrap;
+        # both would allocate an object on this per-event path.
+        telescope_elevation = telescope_target.elevation
+        dt = telescope_elevation.tai - dome_target_elevation.tai
+        dome_elevation_shifted_position = (
+            dome_target_elevation.position + dome_target_elevation.velocity * dt
+        )
+        eldiff = wrap_diff_deg(
+            dome_elevation_shifted_position, telescope_elevation.position
         )
-        eldiff = utils.angle_diff(
-            dome_elevation_shifted.position, telescope_target.elevation.position
-        ).deg
         if abs(eldiff) < self.max_delta_elevation:
             return None
+        if telescope_elevation.velocity == 0:
+            # Already the desired (position, zero velocity, tai) segment.
+            return telescope_elevation
         return simactuators.path.PathSegment(
-            position=telescope_target.elevation.position,
+            position=telescope_elevation.position,
             velocity=0,
-            tai=telescope_target.elevation.tai,
+            tai=telescope_elevation.tai,
         )
 
     def desired_dome_azimuth(
@@ -107,16 +115,31 @@ class SimpleAlgorithm(base_algorithm.BaseAlgorithm):
             return telescope_target.azimuth
 
         # scaled_delta_azimuth is the difference multiplied by cos(target alt).
-        dome_azimuth_shifted = dome_target_azimuth.at(telescope_target.azimuth.tai)
-        scaled_delta_azimuth = utils.angle_diff(
-            telescope_target.azimuth.position, dome_azimuth_shifted.position
-        ).deg * math.cos(telescope_target.elevation.position * RAD_PER_DEG)
+        # Inline dome_target_azimuth.at(tai) and the angle wrap;
+        # both would allocate an object on this per-event path.
+        telescope_azimuth = telescope_target.azimuth
+        dt = telescope_azimuth.tai - dome_target_azimuth.tai
+        dome_azimuth_shifted_position = (
+            dome_target_azimuth.position + dome_target_azimuth.velocity * dt
+        )
+        elevation = telescope_target.elevation.position
+        cached_elevation, cos_elevation = self._cos_elevation_cache
+        if elevation != cached_elevation:
+            cos_elevation = math.cos(elevation * RAD_PER_DEG)
+            self._cos_elevation_cache = (elevation, cos_elevation)
+        scaled_delta_azimuth = (
+            wrap_diff_deg(telescope_azimuth.position, dome_azimuth_shifted_position)
+            * cos_elevation
+        )
         if abs(scaled_delta_azimuth) < self.max_delta_azimuth:
             return None
+        if telescope_azimuth.velocity == 0:
+            # Already the desired (position, zero velocity, tai) segment.
+            return telescope_azimuth
         return simactuators.path.PathSegment(
-            position=telescope_target.azimuth.position,
+            position=telescope_azimuth.position,
             velocity=0,
-            tai=telescope_target.azimuth.tai,
+            tai=telescope_azimuth.tai,
         )
 
     def configure(self, *, max_delta_elevation=5, max_delta_azimuth=5):
@@ -139,8 +162,13 @@ class SimpleAlgorithm(base_algorithm.BaseAlgorithm):
             raise salobj.ExpectedError(
                 f"max_delta_elevation={max_delta_elevation} must not be negative"
             )
-        self.max_delta_azimuth = max_delta_azimuth
-        self.max_delta_elevation = max_delta_elevation
+        # Plain floats, so the hot-path comparisons never pay for
+        # mixed-type arithmetic.
+        self.max_delta_azimuth = float(max_delta_azimuth)
+        self.max_delta_elevation = float(max_delta_elevation)
+        # (elevation, cos(elevation)) from the most recent azimuth check;
+        # the telescope elevation often repeats across target events.
+        self._cos_elevation_cache = (math.nan, math.nan)
 
 
 base_algorithm.AlgorithmRegistry["simple"] = SimpleAlgorithm
@@ -537,6 +537,43 @@ class MTDomeTrajectoryTestCase(
                 vignetted=TelescopeVignetted.FULLY,
             )
 
+    async def test_telescope_vignetted_while_disabled(self):
+        """The telescopeVignetted event must keep updating in DISABLED,
+        even if following mode was never enabled.
+        """
+        async with self.make_csc(
+            initial_state=salobj.State.ENABLED, config_dir=TEST_CONFIG_DIR
+        ):
+            await self.assert_next_summary_state(salobj.State.ENABLED)
+            await self.assert_next_sample(self.remote.evt_followingMode, enabled=False)
+            await self.assert_next_sample(
+                topic=self.remote.evt_telescopeVignetted,
+                azimuth=TelescopeVignetted.UNKNOWN,
+                elevation=TelescopeVignetted.UNKNOWN,
+                shutter=TelescopeVignetted.UNKNOWN,
+                vignetted=TelescopeVignetted.UNKNOWN,
+            )
+
+            await self.remote.cmd_disable.start(timeout=STD_TIMEOUT)
+            await self.assert_next_summary_state(salobj.State.DISABLED)
+
+            # New vignetting inputs must still be processed.
+            await self.publish_telescope_actual_elevation(elevation=0)
+            await self.assert_next_sample(
+                topic=self.remote.evt_telescopeVignetted,
+                azimuth=TelescopeVignetted.UNKNOWN,
+                elevation=TelescopeVignetted.NO,
+                vignetted=TelescopeVignetted.UNKNOWN,
+            )
+
+            await self.publish_telescope_actual_azimuth(azimuth=0)
+            await self.assert_next_sample(
+                topic=self.remote.evt_telescopeVignetted,
+                azimuth=TelescopeVignetted.NO,
+                elevation=TelescopeVignetted.NO,
+                vignetted=TelescopeVignetted.NO,
+            )
+
     async def check_shutter_vignette(self, shutter_position, expected_vignetting):
         """Set various combinations of the shutter to verify vignetting."""
 